@@ -3,82 +3,277 @@ Web UI for Digital Picture Frame Control
 Flask-based interface for configuration and management
 """
 from flask import Flask, render_template, request, jsonify
-import json
+from flask.json.provider import JSONProvider
+import orjson
+import copy
 import os
+import stat
 import subprocess
 import psutil
+import asyncio
+import time
+import threading
+import atexit
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster encode/decode"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CONFIG_FILE = "config.json"
+_IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+
+# Per-directory scan cache: path -> (mtime_ns, direct file count, subdir paths)
+_scan_cache = {}
+
+# Parsed config cache, keyed on the config file's mtime.
+# "raw" holds the serialized bytes on disk so saves can skip no-op writes
+# (handlers mutate the cached dict in place, so comparing dicts won't work).
+_cfg_cache = {"mtime": -1, "data": None, "raw": None}
+
+# Last CPU sample; prime once so the first nonblocking read returns valid data
+_last_cpu = {"t": 0.0, "v": psutil.cpu_percent(interval=None)}
+
+def _count_images_cached(path, _exts=_IMG_EXTS):
+    """Count images under path, re-listing only directories whose mtime moved
+
+    A directory's mtime only changes when entries are added or removed
+    directly inside it - it does NOT propagate from nested subdirectories.
+    So the cache is per directory: an unchanged mtime reuses that
+    directory's own file count and child list, while children are still
+    visited recursively, which catches changes anywhere in the tree. An
+    unchanged tree costs one stat per directory instead of a full listing.
+
+    _exts is bound as a default argument so the hot loop does a local
+    lookup per file instead of a global one.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+    cached = _scan_cache.get(path)
+    if cached and cached[0] == mtime_ns:
+        count, subdirs = cached[1], cached[2]
+    else:
+        count = 0
+        subdirs = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot != -1 and name[dot:].lower() in _exts:
+                            count += 1
+        except OSError:
+            return 0
+        _scan_cache[path] = (mtime_ns, count, subdirs)
+
+    recurse = _count_images_cached
+    return count + sum(recurse(d) for d in subdirs)
+
+def _is_dir(path):
+    """Check that path exists and is a directory with a single stat call"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+def _dedupe_roots(paths):
+    """Reduce scan roots to a minimal cover set
+
+    Resolves each path and drops any root nested under another, so a
+    config listing both /mnt/photos and /mnt/photos/2024 doesn't walk
+    (and count) the subtree twice.
+    """
+    roots = []
+    for path in sorted({os.path.realpath(p) for p in paths}):
+        if not any(path == kept or path.startswith(kept + os.sep) for kept in roots):
+            roots.append(path)
+    return roots
 
 def load_config():
-    """Load configuration from JSON file"""
-    with open(CONFIG_FILE, 'r') as f:
-        return json.load(f)
+    """Load configuration from JSON file (cached until the file changes)"""
+    mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    if mtime == _cfg_cache["mtime"]:
+        return _cfg_cache["data"]
+    with open(CONFIG_FILE, 'rb') as f:
+        raw = f.read()
+    config = orjson.loads(raw)
+    _cfg_cache["data"] = config
+    _cfg_cache["raw"] = raw
+    _cfg_cache["mtime"] = mtime
+    return config
 
 def save_config(config):
-    """Save configuration to JSON file"""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    """Save configuration to JSON file (atomic write, skipped if unchanged)"""
+    raw = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    if raw == _cfg_cache["raw"]:
+        return
+    # Write to a tempfile and rename so a power cut can't leave a torn file
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+    # Update the cache so the next load_config() skips the re-read
+    _cfg_cache["data"] = config
+    _cfg_cache["raw"] = raw
+    _cfg_cache["mtime"] = os.stat(CONFIG_FILE).st_mtime_ns
+
+# Debounced save: coalesces rapid-fire mutations (e.g. a UI slider drag)
+# into a single disk write
+_save_timer = None
+_save_lock = threading.Lock()
+
+def _flush_config():
+    """Write any pending config changes to disk"""
+    global _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+    if _cfg_cache["data"] is not None:
+        save_config(_cfg_cache["data"])
+
+def _schedule_save():
+    """Schedule a config write 200ms out, resetting any pending timer"""
+    global _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+        _save_timer = threading.Timer(0.2, _flush_config)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+# Make sure a pending debounced write still hits disk on shutdown
+atexit.register(_flush_config)
+
+def _apply_ops(config, ops):
+    """Apply a list of mutation operations to an in-memory config
+
+    Each op is a dict with an 'op' key of add_source, remove_source,
+    toggle_overlay or configure_overlay plus that op's arguments.
+    Returns an error message for the first op that fails, or None if
+    everything applied.
+    """
+    # Bind the nested dicts once instead of re-walking the chain per op
+    sources = config['sources']
+    local_paths = sources['local_paths']
+    unraid_shares = sources['unraid_shares']
+    overlays = config['overlays']
+
+    for op in ops:
+        kind = op.get('op')
+
+        if kind == 'add_source':
+            path = op.get('path')
+            if not path or not _is_dir(path):
+                return "Invalid path"
+            if op.get('type') == 'local':
+                if path not in local_paths:
+                    local_paths.append(path)
+            elif op.get('type') == 'unraid':
+                if path not in unraid_shares:
+                    unraid_shares.append(path)
+
+        elif kind == 'remove_source':
+            path = op.get('path')
+            if op.get('type') == 'local' and path in local_paths:
+                local_paths.remove(path)
+            elif op.get('type') == 'unraid' and path in unraid_shares:
+                unraid_shares.remove(path)
+
+        elif kind == 'toggle_overlay':
+            entry = overlays.get(op.get('name'))
+            if entry is None:
+                return "Overlay not found"
+            entry['enabled'] = not entry['enabled']
+
+        elif kind == 'configure_overlay':
+            entry = overlays.get(op.get('name'))
+            if entry is None:
+                return "Overlay not found"
+            entry.update(op.get('settings') or {})
+
+        else:
+            return f"Unknown op: {kind}"
+
+    return None
+
+# Rendered index page cache, keyed on the config mtime
+_index_cache = {"mtime": -1, "html": None}
 
 @app.route('/')
 def index():
     """Main control panel"""
     config = load_config()
-    return render_template('index.html', config=config)
+    # The template output only changes when the config does, so reuse the
+    # rendered HTML until the config mtime moves
+    if _cfg_cache["mtime"] == _index_cache["mtime"]:
+        return _index_cache["html"]
+    html = render_template('index.html', config=config)
+    _index_cache["html"] = html
+    _index_cache["mtime"] = _cfg_cache["mtime"]
+    return html
 
 @app.route('/api/config', methods=['GET', 'POST'])
 def api_config():
     """Get or update configuration"""
     if request.method == 'GET':
-        return jsonify(load_config())
-    
+        config = load_config()
+        # Pollers send back the ETag; an unchanged config costs no body
+        etag = f'W/"{_cfg_cache["mtime"]}"'
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304
+        resp = jsonify(config)
+        resp.headers['ETag'] = etag
+        return resp
+
     elif request.method == 'POST':
         config = request.json
         save_config(config)
         return jsonify({"status": "success", "message": "Configuration updated"})
 
 @app.route('/api/sources/scan', methods=['POST'])
-def scan_sources():
+async def scan_sources():
     """Scan configured sources for images"""
     config = load_config()
-    image_count = 0
-    
-    # Count images in local paths
-    for path in config['sources']['local_paths']:
-        if os.path.exists(path):
-            for root, dirs, files in os.walk(path):
-                image_count += len([f for f in files if f.lower().endswith(
-                    ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'))])
-    
-    # Count images in Unraid shares
-    for share in config['sources']['unraid_shares']:
-        if os.path.exists(share):
-            for root, dirs, files in os.walk(share):
-                image_count += len([f for f in files if f.lower().endswith(
-                    ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'))])
-    
-    return jsonify({"image_count": image_count})
+
+    # Local paths and Unraid shares are independent mounts - count them in parallel.
+    # Running the walks in threads keeps the worker free for other requests.
+    sources = config['sources']
+    roots = [r for r in _dedupe_roots(
+        sources['local_paths'] + sources['unraid_shares'])
+        if _is_dir(r)]
+    if not roots:
+        return jsonify({"image_count": 0})
+
+    counts = await asyncio.gather(
+        *[asyncio.to_thread(_count_images_cached, r) for r in roots])
+
+    return jsonify({"image_count": sum(counts)})
 
 @app.route('/api/sources/add', methods=['POST'])
 def add_source():
     """Add a new image source"""
     data = request.json
-    source_type = data.get('type')  # 'local' or 'unraid'
-    path = data.get('path')
-    
-    if not path or not os.path.exists(path):
-        return jsonify({"status": "error", "message": "Invalid path"}), 400
-    
     config = load_config()
-    
-    if source_type == 'local':
-        if path not in config['sources']['local_paths']:
-            config['sources']['local_paths'].append(path)
-    elif source_type == 'unraid':
-        if path not in config['sources']['unraid_shares']:
-            config['sources']['unraid_shares'].append(path)
-    
+
+    error = _apply_ops(config, [
+        {'op': 'add_source', 'type': data.get('type'), 'path': data.get('path')}])
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
     save_config(config)
     return jsonify({"status": "success", "message": "Source added"})
 
@@ -86,18 +281,32 @@ def add_source():
 def remove_source():
     """Remove an image source"""
     data = request.json
-    source_type = data.get('type')
-    path = data.get('path')
-    
     config = load_config()
-    
-    if source_type == 'local' and path in config['sources']['local_paths']:        config['sources']['local_paths'].remove(path)
-    elif source_type == 'unraid' and path in config['sources']['unraid_shares']:
-        config['sources']['unraid_shares'].remove(path)
-    
+
+    _apply_ops(config, [
+        {'op': 'remove_source', 'type': data.get('type'), 'path': data.get('path')}])
+
     save_config(config)
     return jsonify({"status": "success", "message": "Source removed"})
 
+@app.route('/api/config/patch', methods=['POST'])
+def patch_config():
+    """Apply a batch of config mutations in a single read-modify-write"""
+    ops = request.json
+    if not isinstance(ops, list):
+        return jsonify({"status": "error", "message": "Expected a list of ops"}), 400
+
+    # Work on a copy: load_config() hands back the shared cached dict, and a
+    # batch that fails partway through must not leave earlier ops applied to
+    # the live config. The copy only replaces the cache via save_config().
+    config = copy.deepcopy(load_config())
+    error = _apply_ops(config, ops)
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
+    save_config(config)
+    return jsonify({"status": "success", "message": f"Applied {len(ops)} changes"})
+
 @app.route('/api/overlay/toggle', methods=['POST'])
 def toggle_overlay():
     """Toggle overlay on/off"""
@@ -105,31 +314,32 @@ def toggle_overlay():
     overlay_name = data.get('name')
     
     config = load_config()
-    
-    if overlay_name in config['overlays']:
-        config['overlays'][overlay_name]['enabled'] = not config['overlays'][overlay_name]['enabled']
-        save_config(config)
-        return jsonify({
-            "status": "success", 
-            "enabled": config['overlays'][overlay_name]['enabled']
-        })
-    
-    return jsonify({"status": "error", "message": "Overlay not found"}), 404
+
+    error = _apply_ops(config, [{'op': 'toggle_overlay', 'name': overlay_name}])
+    if error:
+        return jsonify({"status": "error", "message": error}), 404
+
+    _schedule_save()
+    return jsonify({
+        "status": "success",
+        "enabled": config['overlays'][overlay_name]['enabled']
+    })
 
 @app.route('/api/overlay/configure', methods=['POST'])
 def configure_overlay():
     """Update overlay configuration"""
     data = request.json
     overlay_name = data.get('name')
-    settings = data.get('settings')    
+    settings = data.get('settings')
     config = load_config()
-    
-    if overlay_name in config['overlays']:
-        config['overlays'][overlay_name].update(settings)
-        save_config(config)
-        return jsonify({"status": "success", "message": "Overlay configured"})
-    
-    return jsonify({"status": "error", "message": "Overlay not found"}), 404
+
+    error = _apply_ops(config, [
+        {'op': 'configure_overlay', 'name': overlay_name, 'settings': settings}])
+    if error:
+        return jsonify({"status": "error", "message": error}), 404
+
+    _schedule_save()
+    return jsonify({"status": "success", "message": "Overlay configured"})
 
 @app.route('/api/display/control', methods=['POST'])
 def display_control():
@@ -147,23 +357,43 @@ def display_control():
 @app.route('/api/system/stats')
 def system_stats():
     """Get system statistics"""
-    cpu_percent = psutil.cpu_percent(interval=1)
+    # Nonblocking sample, refreshed at most once per second - the old
+    # interval=1 call slept a full second and pinned a worker per request
+    now = time.monotonic()
+    if now - _last_cpu["t"] > 1.0:
+        _last_cpu["v"] = psutil.cpu_percent(interval=None)
+        _last_cpu["t"] = now
+    cpu_percent = _last_cpu["v"]
+
+    # Stats only refresh once per second, so key an ETag on the sample time
+    etag = f'W/"{_last_cpu["t"]:.3f}"'
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+
     memory = psutil.virtual_memory()
-    
-    return jsonify({
+
+    resp = jsonify({
         "cpu": cpu_percent,
         "memory": {
-            "percent": memory.percent,            "used_gb": memory.used / (1024**3),
+            "percent": memory.percent,
+            "used_gb": memory.used / (1024**3),
             "total_gb": memory.total / (1024**3)
         }
     })
+    resp.headers['ETag'] = etag
+    return resp
 
 if __name__ == '__main__':
     config = load_config()
     web_config = config.get('web_ui', {})
-    
-    app.run(
-        host=web_config.get('host', '0.0.0.0'),
-        port=web_config.get('port', 5000),
-        debug=True
-    )
\ No newline at end of file
+    host = web_config.get('host', '0.0.0.0')
+    port = web_config.get('port', 5000)
+
+    if os.environ.get("FLASK_DEV"):
+        # Werkzeug dev server (single-threaded, reloader/debugger on)
+        app.run(host=host, port=port, debug=True)
+    else:
+        # Production: waitress serves requests across a thread pool instead
+        # of serializing everything behind the dev server
+        from waitress import serve
+        serve(app, host=host, port=port, threads=8)
\ No newline at end of file
@@ -3,15 +3,63 @@ Digital Picture Frame Display Engine
 Full-screen image display with overlay support
 """
 import pygame
+import io
 import json
+import logging
+import mmap
 import os
+import queue
+import threading
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageEnhance
-import random
+from PIL import Image, ImageDraw, ImageFilter, ImageFont, ImageOps
 import colorsys
 import ctypes
+import functools
+import numpy as np
+
+try:
+    # SIMD-accelerated resize (Rust fast_image_resize, AVX2/SSE4.1 kernels)
+    from cykooz.resizer import Resizer, ResizeAlg, FilterType, CpuExtensions
+except ImportError:
+    Resizer = None
+
+# Debug chatter stays off the hot path: at the default WARNING level the
+# logger skips even the f-string-equivalent formatting work
+logger = logging.getLogger(__name__)
+
+_IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+
+@functools.lru_cache(maxsize=32)
+def _get_font(name, size):
+    """Load a PIL truetype font once per (name, size)"""
+    try:
+        return ImageFont.truetype(name, size)
+    except:
+        return ImageFont.load_default()
+
+def _scan(path):
+    """Yield image file paths under path via os.scandir recursion
+
+    Uses the type info cached from the directory read (no extra stat per
+    file) and checks extensions on the raw name instead of building a
+    pathlib.Path per file. Matters most on SMB shares, where every stat
+    is a network round trip.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan(entry)
+                elif entry.is_file():
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot != -1 and name[dot:].lower() in _IMG_EXTS:
+                        yield entry.path
+    except OSError:
+        pass
 
 class PictureFrameDisplay:
     # Windows API constants
@@ -25,6 +73,8 @@ class PictureFrameDisplay:
         # Load configuration
         self.config_path = config_path
         self.config_mtime = 0
+        self._last_cfg_check = 0.0
+        self._sources_fingerprint = None
         self.load_config()
         
         # Initialize pygame
@@ -46,20 +96,70 @@ class PictureFrameDisplay:
         
         # Image management
         self.current_image = None
+        self._base_surface = None
         self.image_list = []
+        self._perm = np.array([], dtype=np.intp)  # shuffled display order
         self.current_index = 0
         self.last_change = time.time()
         self.interval = display_config['slideshow_interval']
         
         # Blank/power save mode
         self.blank_mode = False
+        self._blank_drawn = False
         self.mode_start_time = time.time()
         self.slideshow_duration = 999999999  # Will be set by load_config()
         self.blank_duration = 30  # Will be set by load_config()
         
+        # SIMD resizer, built once so filter coefficient tables are reused
+        # across images (falls back to PIL Lanczos when unavailable)
+        self._resizer = None
+        if Resizer is not None:
+            self._resizer = Resizer(ResizeAlg.convolution(FilterType.lanczos3))
+            try:
+                self._resizer.cpu_extensions = CpuExtensions.avx2
+            except ValueError:
+                pass  # CPU doesn't support AVX2, keep auto-detected extensions
+
+        # pygame fonts cached by size - SysFont re-parses font files, so
+        # building them per frame would undo the pygame overlay win
+        self._pygame_fonts = {}
+
+        # One-entry cache of the current image as a numpy array, shared by
+        # the color-sampling helpers
+        self._np_cache_src = None
+        self._np_cache_arr = None
+
+        # Pre-rendered overlay pieces, rebuilt only when the text changes
+        # (clock once a second, date once a minute) - the other 29 frames
+        # just re-blit the cached surfaces
+        self._overlay_signature = None
+        self._overlay_blits = []
+
+        # LRU of finished decodes: (path, mtime_ns, size) -> raw RGB bytes.
+        # 16 entries is ~95 MB at 1080p; revisits skip the decode entirely,
+        # and a changed file misses naturally because the mtime is in the key
+        self._decode_cache = OrderedDict()
+        self._decode_cache_max = 16
+        self._decode_cache_lock = threading.Lock()
+
+        # Small LRU of mmap'd image files, keyed (path, mtime_ns). Decode
+        # reads come straight from the OS page cache with no buffer copies,
+        # so slideshow wraparounds reuse warm pages instead of re-reading
+        # multi-MB files over SMB
+        self._mmap_cache = OrderedDict()
+        self._mmap_cache_max = 8
+        self._mmap_lock = threading.Lock()
+
+        # Background preloader: decodes the next image while the current one
+        # is on screen, so next_image() doesn't stall the display loop
+        self._preload_req = queue.Queue()
+        self._preload_q = queue.Queue(maxsize=2)
+        self._preload_thread = threading.Thread(target=self._preloader, daemon=True)
+        self._preload_thread.start()
+
         # Load images from sources
         self.load_images()
-        
+
     def turn_monitor_off(self):
         """Turn off monitor using Windows API"""
         try:
@@ -69,9 +169,9 @@ class PictureFrameDisplay:
                 self.SC_MONITORPOWER,
                 self.MONITOR_OFF
             )
-            print("Monitor powered OFF")
+            logger.debug("Monitor powered OFF")
         except Exception as e:
-            print(f"Failed to turn off monitor: {e}")
+            logger.error("Failed to turn off monitor: %s", e)
     
     def turn_monitor_on(self):
         """Turn on monitor using Windows API"""
@@ -89,9 +189,9 @@ class PictureFrameDisplay:
             ES_CONTINUOUS = 0x80000000
             ES_DISPLAY_REQUIRED = 0x00000002
             ctypes.windll.kernel32.SetThreadExecutionState(ES_CONTINUOUS | ES_DISPLAY_REQUIRED)
-            print("Monitor powered ON")
+            logger.debug("Monitor powered ON")
         except Exception as e:
-            print(f"Failed to turn on monitor: {e}")
+            logger.error("Failed to turn on monitor: %s", e)
         
     def load_config(self):
         """Load or reload configuration from file"""
@@ -111,117 +211,250 @@ class PictureFrameDisplay:
             else:
                 self.slideshow_duration = 999999999  # Effectively disabled
                 self.blank_duration = 30
-                
-            print(f"Config reloaded - interval: {self.interval}s, power save: {display_config.get('enable_power_save', False)}")
+
+            # Fingerprint the sources so reloads can tell whether a rescan
+            # of the filesystem is actually needed
+            self._sources_fingerprint = json.dumps(
+                self.config['sources'], sort_keys=True)
+
+            logger.debug("Config reloaded - interval: %ss, power save: %s",
+                         self.interval, display_config.get('enable_power_save', False))
         except Exception as e:
-            print(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
     
     def check_config_changes(self):
-        """Check if config file has been modified and reload if needed"""
+        """Check if config file has been modified and reload if needed
+
+        Stat the file at most once per second - it rarely changes, and at
+        30 FPS the per-frame stat was a pointless syscall 30 times a second.
+        """
+        now = time.time()
+        if now - self._last_cfg_check < 1.0:
+            return False
+        self._last_cfg_check = now
         try:
             current_mtime = os.path.getmtime(self.config_path)
             if current_mtime != self.config_mtime:
-                print("Config file changed - reloading...")
+                logger.debug("Config file changed - reloading...")
+                old_sources = self._sources_fingerprint
                 self.load_config()
-                self.load_images()  # Reload images if sources changed
+                # Only rescan the filesystem when the sources changed -
+                # tweaking the interval shouldn't cost a full library walk
+                if self._sources_fingerprint != old_sources:
+                    self.load_images()
                 return True
         except Exception as e:
-            print(f"Error checking config: {e}")
+            logger.error("Error checking config: %s", e)
         return False
     
     def load_images(self):
         """Scan all configured sources for images"""
-        self.image_list = []
-        
-        # Load from local paths
-        for path in self.config['sources']['local_paths']:
-            if os.path.exists(path):
-                self.scan_directory(path)
-        
-        # Load from Unraid shares
-        for share in self.config['sources']['unraid_shares']:
-            if os.path.exists(share):
-                self.scan_directory(share)
-        
-        # Shuffle for variety
-        random.shuffle(self.image_list)        
-        print(f"Loaded {len(self.image_list)} images")
+        # Local paths and network shares are independent mounts; walking them
+        # in parallel overlaps the syscall/network wait, so a slow SMB share
+        # no longer blocks scanning of fast local storage
+        sources = [p for p in (self.config['sources']['local_paths'] +
+                               self.config['sources']['unraid_shares'])
+                   if os.path.exists(p)]
+
+        if sources:
+            with ThreadPoolExecutor(max_workers=min(8, len(sources))) as ex:
+                results = ex.map(self._scan_to_list, sources)
+                self.image_list = [p for sub in results for p in sub]
+        else:
+            self.image_list = []
+
+        # Shuffle for variety - permute fixed-width indices instead of
+        # moving the path strings themselves around
+        self._perm = np.random.permutation(len(self.image_list))
+        # A reload can shrink the library; don't leave current_index pointing
+        # past the end of the new permutation
+        if self.current_index >= len(self.image_list):
+            self.current_index = 0
+        logger.debug("Loaded %d images", len(self.image_list))
+
+        # Anything decoded ahead of time refers to the old list
+        self._reset_preload()
     
+    @staticmethod
+    def _scan_to_list(path):
+        """Scan one source into a local list (no shared-state contention)"""
+        return list(_scan(path))
+
     def scan_directory(self, path):
         """Recursively scan directory for image files"""
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
-        
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if Path(file).suffix.lower() in valid_extensions:
-                    self.image_list.append(os.path.join(root, file))
+        self.image_list.extend(_scan(path))
     
+    def _image_path(self, slot):
+        """Path for a slideshow slot, mapped through the shuffled permutation"""
+        return self.image_list[int(self._perm[slot])]
+
+    def _preloader(self):
+        """Worker thread: decode requested images ahead of the main loop"""
+        while True:
+            index = self._preload_req.get()
+            try:
+                if self.image_list:
+                    index %= len(self.image_list)
+                    self._preload_q.put((index, self._decode_image(self._image_path(index))))
+            except Exception as e:
+                # A reload can swap image_list/_perm under us mid-request; a
+                # failed preload just means the main loop decodes it itself,
+                # but an escaped exception would kill this thread for good
+                logger.error("Preload of index %d failed: %s", index, e)
+
+    def _reset_preload(self):
+        """Drop stale preloaded images (after reload or manual jump)"""
+        for q in (self._preload_req, self._preload_q):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+
+    def _request_preload(self):
+        """Ask the preloader for the image after the current one"""
+        if self.image_list:
+            self._preload_req.put((self.current_index + 1) % len(self.image_list))
+
     def load_current_image(self):
         """Load and scale current image to fit screen"""
         if not self.image_list:
-            print("ERROR: No images in list")
+            logger.warning("ERROR: No images in list")
             return None
-        
+        return self._decode_image(self._image_path(self.current_index))
+
+    def _decode_image(self, img_path):
+        """Decode, rotate, scale and dim one image (no slideshow state used)"""
         try:
-            img_path = self.image_list[self.current_index]
-            print(f"Loading: {img_path}")
-            img = Image.open(img_path)
-            print(f"  Opened: {img.size}, mode: {img.mode}")
-            
-            # Apply EXIF rotation if present
-            img = ImageOps.exif_transpose(img)
-            print(f"  After rotation: {img.size}")
+            key = (img_path, os.stat(img_path).st_mtime_ns, (self.width, self.height))
+        except OSError:
+            key = None
+
+        if key is not None:
+            with self._decode_cache_lock:
+                cached = self._decode_cache.get(key)
+                if cached is not None:
+                    self._decode_cache.move_to_end(key)
+            if cached is not None:
+                logger.debug("Cache hit: %s", img_path)
+                return Image.frombytes('RGB', (self.width, self.height), cached)
+
+        img = self._decode_image_uncached(img_path)
+
+        if img is not None and key is not None:
+            with self._decode_cache_lock:
+                self._decode_cache[key] = img.tobytes()
+                self._decode_cache.move_to_end(key)
+                while len(self._decode_cache) > self._decode_cache_max:
+                    self._decode_cache.popitem(last=False)
+        return img
+
+    def _open_image(self, img_path):
+        """Open an image through a cached mmap of the file
+
+        mmap objects are file-like, so PIL decodes directly out of the
+        kernel's page cache. Evicted mappings are just dropped (not closed)
+        in case a decode in the other thread still references them; the GC
+        unmaps them once unreferenced.
+        """
+        try:
+            key = (img_path, os.stat(img_path).st_mtime_ns)
+            with self._mmap_lock:
+                mm = self._mmap_cache.get(key)
+                if mm is not None:
+                    self._mmap_cache.move_to_end(key)
+            if mm is None:
+                with open(img_path, 'rb') as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                with self._mmap_lock:
+                    self._mmap_cache[key] = mm
+                    while len(self._mmap_cache) > self._mmap_cache_max:
+                        self._mmap_cache.popitem(last=False)
+            # A mmap has one file position shared by everyone holding it, so
+            # the preloader and main thread decoding the same file would
+            # interleave reads. Give each caller its own wrapper with an
+            # independent position instead of the mmap itself.
+            return Image.open(io.BytesIO(memoryview(mm)))
+        except (OSError, ValueError):
+            # Empty file, mmap failure, etc - plain open still works
+            return Image.open(img_path)
+
+    def _decode_image_uncached(self, img_path):
+        """Full decode pipeline for a single image"""
+        try:
+            logger.debug("Loading: %s", img_path)
+            img = self._open_image(img_path)
+            logger.debug("  Opened: %s, mode: %s", img.size, img.mode)
             
+            # Apply EXIF rotation only when the orientation tag is actually
+            # set - exif_transpose materializes a whole new image even for
+            # the identity orientation, which is the common case
+            orientation = img.getexif().get(274, 1)  # 274 = Orientation
+            if orientation != 1:
+                img = ImageOps.exif_transpose(img)
+                logger.debug("  After rotation: %s", img.size)
+
             # Convert to RGB if necessary
             if img.mode != 'RGB':
                 img = img.convert('RGB')
             
-            # Calculate scale to fill screen (cover mode)
+            # Cover mode: crop the source to the screen's aspect ratio first,
+            # then resize that region straight to screen size - no oversized
+            # intermediate image whose edges get thrown away after scaling
             img_ratio = img.width / img.height
             screen_ratio = self.width / self.height
-            
+
             if img_ratio > screen_ratio:
-                # Image is wider - scale to height, crop width
-                new_height = self.height
-                new_width = int(img.width * (self.height / img.height))
+                # Image is wider - crop width (center)
+                src_w = int(img.height * screen_ratio)
+                src_h = img.height
             else:
-                # Image is taller - scale to width, crop height
-                new_width = self.width
-                new_height = int(img.height * (self.width / img.width))
-            
-            # Scale image
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            print(f"  Scaled to: {img.size}")
-            
-            # Crop to screen size (center crop)
-            left = (new_width - self.width) // 2
-            top = (new_height - self.height) // 2
-            img = img.crop((left, top, left + self.width, top + self.height))
-            print(f"  Cropped to: {img.size}")
-            
-            # Apply brightness dimming (50% brightness as POC)
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(0.5)  # 0.5 = 50% brightness
-            print(f"  Dimmed to 50% brightness")
+                # Image is taller - crop height (center)
+                src_w = img.width
+                src_h = int(img.width / screen_ratio)
+
+            left = (img.width - src_w) // 2
+            top = (img.height - src_h) // 2
+            img = img.crop((left, top, left + src_w, top + src_h))
+            logger.debug("  Cropped to: %s", img.size)
+
+            # Scale image (SIMD path works on RGBA/U8x4 pixels)
+            if self._resizer is not None:
+                src = img.convert('RGBA')
+                dst = Image.new('RGBA', (self.width, self.height))
+                self._resizer.resize_pil(src, dst)
+                img = dst.convert('RGB')
+            else:
+                img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
+            logger.debug("  Scaled to: %s", img.size)
             
             return img
         except Exception as e:
-            print(f"Error loading image {img_path}: {e}")
+            logger.error("Error loading image %s: %s", img_path, e)
             return None
     
-    def draw_text_with_glow(self, draw, pos, text, font, color, glow_size=3):
-        """Draw text with a subtle glow effect"""
+    def draw_text_with_glow(self, image, draw, pos, text, font, color, glow_size=3):
+        """Draw text with a subtle glow effect
+
+        The glow is a single text raster blurred with a Gaussian, instead of
+        re-drawing the text at every offset in a (2*glow_size+1)^2 grid -
+        one glyph rasterization instead of 49.
+        """
         x, y = pos
-        
+
         # Create very light glow color (barely visible white)
         glow_color = (255, 255, 255, 40)
-        
-        # Draw glow in multiple directions
-        for offset_x in range(-glow_size, glow_size + 1):
-            for offset_y in range(-glow_size, glow_size + 1):
-                if offset_x != 0 or offset_y != 0:  # Skip center
-                    draw.text((x + offset_x, y + offset_y), text, font=font, fill=glow_color)
-        
+
+        # Rasterize once into a small tile and let the blur do the spreading
+        bbox = draw.textbbox((0, 0), text, font=font)
+        text_w = bbox[2] - bbox[0]
+        text_h = bbox[3] - bbox[1]
+        pad = glow_size + 4
+        tile = Image.new('RGBA', (text_w + 2 * pad, text_h + 2 * pad))
+        ImageDraw.Draw(tile).text((pad, pad), text, font=font, fill=glow_color)
+        blurred = tile.filter(ImageFilter.GaussianBlur(glow_size))
+        image.paste(blurred, (x - pad, y - pad), blurred)
+
         # Draw main text on top
         draw.text(pos, text, font=font, fill=color)
     
@@ -229,20 +462,11 @@ class PictureFrameDisplay:
         """Calculate average color of entire image with enhanced contrast"""
         # Resize for faster processing
         small = image.resize((100, 100), Image.Resampling.LANCZOS)
-        pixels = list(small.getdata())
-        
-        # Calculate average RGB
-        r_sum, g_sum, b_sum = 0, 0, 0
-        for pixel in pixels:
-            r_sum += pixel[0]
-            g_sum += pixel[1]
-            b_sum += pixel[2]
-        
-        count = len(pixels)
-        avg_r = r_sum / count / 255.0
-        avg_g = g_sum / count / 255.0
-        avg_b = b_sum / count / 255.0
-        
+
+        # Average RGB in one C-level reduction instead of a Python pixel loop
+        arr = np.asarray(small.convert('RGB'), dtype=np.uint32)
+        avg_r, avg_g, avg_b = arr.reshape(-1, 3).mean(axis=0) / 255.0
+
         # Convert to HSL
         h, l, s = colorsys.rgb_to_hls(avg_r, avg_g, avg_b)
         
@@ -257,6 +481,17 @@ class PictureFrameDisplay:
         
         return (int(r * 255), int(g * 255), int(b * 255), 230)
     
+    def _image_np(self, image):
+        """Numpy array of an image, cached for repeat samples of one frame
+
+        Converting PIL -> numpy copies the pixel buffer, so do it once per
+        image and let every region sample slice the cached array instead.
+        """
+        if self._np_cache_src is not image:
+            self._np_cache_src = image
+            self._np_cache_arr = np.asarray(image)
+        return self._np_cache_arr
+
     def get_contrast_color(self, image, pos, width, height):
         """Calculate complementary color for maximum contrast using color theory"""
         # Sample region where text will be drawn
@@ -268,27 +503,15 @@ class PictureFrameDisplay:
         if x2 <= x1 or y2 <= y1:
             return (255, 255, 255, 230)  # Default to white
         
-        # Crop region and calculate average color
-        region = image.crop((x1, y1, x2, y2))
-        pixels = list(region.getdata())
-        
-        # Calculate average RGB
-        r_sum, g_sum, b_sum = 0, 0, 0
-        for pixel in pixels:
-            if isinstance(pixel, int):
-                r_sum += pixel
-                g_sum += pixel
-                b_sum += pixel
-            else:
-                r_sum += pixel[0]
-                g_sum += pixel[1]
-                b_sum += pixel[2]
-        
-        count = len(pixels)
-        avg_r = r_sum / count / 255.0
-        avg_g = g_sum / count / 255.0
-        avg_b = b_sum / count / 255.0
-        
+        # Slice the sample region out of the cached array - a zero-copy view,
+        # no PIL crop allocation. numpy handles grayscale vs RGB by array
+        # shape, so no per-pixel isinstance branch
+        region = self._image_np(image)[y1:y2, x1:x2]
+        if region.ndim == 2:
+            avg_r = avg_g = avg_b = region.mean() / 255.0
+        else:
+            avg_r, avg_g, avg_b = region[:, :, :3].reshape(-1, 3).mean(axis=0) / 255.0
+
         # Convert RGB to HSL
         h, l, s = colorsys.rgb_to_hls(avg_r, avg_g, avg_b)
         
@@ -326,10 +549,7 @@ class PictureFrameDisplay:
             if now.second % 2 == 1:
                 text = text.replace(':', ' ')
             
-            try:
-                font = ImageFont.truetype("arial.ttf", cfg['font_size'])
-            except:
-                font = ImageFont.load_default()
+            font = _get_font("arial.ttf", cfg['font_size'])
             
             bbox = draw.textbbox((0, 0), text, font=font)
             text_width = bbox[2] - bbox[0]
@@ -343,10 +563,7 @@ class PictureFrameDisplay:
             now = datetime.now()
             text = now.strftime(cfg['format'])
             
-            try:
-                font = ImageFont.truetype("arial.ttf", cfg['font_size'])
-            except:
-                font = ImageFont.load_default()
+            font = _get_font("arial.ttf", cfg['font_size'])
             
             bbox = draw.textbbox((0, 0), text, font=font)
             text_width = bbox[2] - bbox[0]
@@ -398,10 +615,7 @@ class PictureFrameDisplay:
         if now.second % 2 == 1:
             text = text.replace(':', ' ')
         
-        try:
-            font = ImageFont.truetype("arial.ttf", cfg['font_size'])
-        except:
-            font = ImageFont.load_default()
+        font = _get_font("arial.ttf", cfg['font_size'])
         
         # Calculate position
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -433,10 +647,7 @@ class PictureFrameDisplay:
         cfg = self.config['overlays']['date']
         now = datetime.now()
         text = now.strftime(cfg['format'])        
-        try:
-            font = ImageFont.truetype("arial.ttf", cfg['font_size'])
-        except:
-            font = ImageFont.load_default()
+        font = _get_font("arial.ttf", cfg['font_size'])
         
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
@@ -471,9 +682,7 @@ class PictureFrameDisplay:
         # TODO: Implement weather API call
         text = "Weather API not configured"
         
-        try:
-            font = ImageFont.truetype("arial.ttf", cfg['font_size'])
-        except:            font = ImageFont.load_default()
+        font = _get_font("arial.ttf", cfg['font_size'])
         
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
@@ -491,10 +700,7 @@ class PictureFrameDisplay:
         # TODO: Implement system stats collection
         text = "System Stats"
         
-        try:
-            font = ImageFont.truetype("arial.ttf", cfg['font_size'])
-        except:
-            font = ImageFont.load_default()
+        font = _get_font("arial.ttf", cfg['font_size'])
         
         bbox = draw.textbbox((0, 0), text, font=font)
         text_width = bbox[2] - bbox[0]
@@ -523,12 +729,135 @@ class PictureFrameDisplay:
     def next_image(self):
         """Advance to next image in slideshow"""
         if not self.image_list:
-            print("No images in list")
-            return        
+            logger.debug("No images in list")
+            return
         self.current_index = (self.current_index + 1) % len(self.image_list)
-        print(f"Advancing to image {self.current_index + 1}/{len(self.image_list)}")
+        logger.debug("Advancing to image %d/%d", self.current_index + 1, len(self.image_list))
         self.last_change = time.time()
-        self.current_image = self.load_current_image()
+
+        # Use the preloaded decode if it matches; fall back to a sync load
+        img = None
+        try:
+            while True:
+                index, decoded = self._preload_q.get_nowait()
+                if index == self.current_index and decoded is not None:
+                    img = decoded
+                    break
+        except queue.Empty:
+            pass
+        if img is None:
+            img = self.load_current_image()
+        self.current_image = img
+        self._update_base_surface()
+
+        # Kick off the decode of the following image
+        self._request_preload()
+
+    def _update_base_surface(self):
+        """Convert the current PIL image to a display-format pygame surface
+
+        Done once per image change; .convert() matches the display's native
+        pixel layout so every subsequent blit is a plain copy instead of a
+        per-pixel format conversion.
+        """
+        img = self.current_image
+        if img is None:
+            self._base_surface = None
+            return
+        surf = pygame.image.fromstring(img.tobytes(), img.size, img.mode)
+        surf = surf.convert()
+        # Apply the 50% brightness dim here with SDL's multiply blit (one
+        # SIMD pass, once per image) instead of a PIL pass in the decode
+        surf.fill((128, 128, 128), special_flags=pygame.BLEND_RGB_MULT)
+        self._base_surface = surf
+
+    def _get_pygame_font(self, size):
+        """Get a cached pygame font for the given size"""
+        font = self._pygame_fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont('arial', size)
+            self._pygame_fonts[size] = font
+        return font
+
+    def render_overlays_pygame(self):
+        """Blit the overlay layer, re-rendering it only when the text changes
+
+        The clock text changes once a second and the date once a minute, so
+        for 29 of every 30 frames this is just a handful of cached small
+        surface blits - no text rasterization at all.
+        """
+        overlays = self.config['overlays']
+        now = datetime.now()
+
+        clock_text = None
+        date_text = None
+
+        if overlays['clock']['enabled']:
+            cfg = overlays['clock']
+            clock_text = now.strftime(cfg['format'])
+            if now.second % 2 == 1:
+                clock_text = clock_text.replace(':', ' ')
+
+        if overlays['date']['enabled']:
+            date_text = now.strftime(overlays['date']['format'])
+
+        signature = (clock_text, date_text,
+                     overlays['clock']['font_size'], overlays['date']['font_size'],
+                     overlays['weather']['enabled'], overlays['system_stats']['enabled'])
+        if signature != self._overlay_signature:
+            self._overlay_blits = self._build_overlay_blits(clock_text, date_text)
+            self._overlay_signature = signature
+
+        for surf, pos in self._overlay_blits:
+            self.screen.blit(surf, pos)
+
+    def _build_overlay_blits(self, clock_text, date_text):
+        """Render the overlay surfaces for the given texts"""
+        overlays = self.config['overlays']
+        blits = []
+
+        clock_surf = None
+        date_surf = None
+
+        if clock_text is not None:
+            font = self._get_pygame_font(overlays['clock']['font_size'])
+            clock_surf = font.render(clock_text, True, (255, 255, 255))
+
+        if date_text is not None:
+            font = self._get_pygame_font(overlays['date']['font_size'])
+            date_surf = font.render(date_text, True, (255, 255, 255))
+
+        # Bar sized to clock height with even padding, as before
+        if clock_surf:
+            padding = 8
+            bar_height = clock_surf.get_height() + padding * 2
+            bar = pygame.Surface((self.width, bar_height), pygame.SRCALPHA)
+            bar.fill((0, 0, 0, 120))
+            blits.append((bar, (0, 0)))
+
+            blits.append((clock_surf,
+                          (self.width - clock_surf.get_width() - 20, padding)))
+            if date_surf:
+                blits.append((date_surf, (20, padding)))
+
+        # Weather overlay (placeholder until the API is wired up)
+        if overlays['weather']['enabled'] and overlays['weather'].get('api_key'):
+            cfg = overlays['weather']
+            font = self._get_pygame_font(cfg['font_size'])
+            surf = font.render("Weather API not configured", True,
+                               tuple(cfg['color'][:3]))
+            blits.append((surf, self.calculate_position(
+                cfg['position'], surf.get_width(), surf.get_height())))
+
+        # System stats overlay (placeholder)
+        if overlays['system_stats']['enabled']:
+            cfg = overlays['system_stats']
+            font = self._get_pygame_font(cfg['font_size'])
+            surf = font.render("System Stats", True, tuple(cfg['color'][:3]))
+            blits.append((surf, self.calculate_position(
+                cfg['position'], surf.get_width(), surf.get_height())))
+
+        return blits
     
     def run(self):
         """Main display loop"""
@@ -537,48 +866,53 @@ class PictureFrameDisplay:
         # Hide mouse cursor during slideshow
         pygame.mouse.set_visible(False)
         
-        # Load first image
+        # Load first image and start decoding the next one in the background
         if self.image_list:
             self.current_image = self.load_current_image()
+            self._update_base_surface()
+            self._request_preload()
         
         while running:
+            # One clock read per iteration, reused by every check below
+            now = time.time()
+
             # Handle events
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.mouse.set_visible(True)
                     running = False
                 elif event.type == pygame.KEYDOWN:
-                    print(f"Key pressed: {event.key}")  # Debug key code
+                    logger.debug("Key pressed: %s", event.key)  # Debug key code
                     
                     # Wake monitor if in blank mode
                     if self.blank_mode and event.key != pygame.K_ESCAPE:
-                        print("Key detected - waking monitor")
+                        logger.debug("Key detected - waking monitor")
                         self.turn_monitor_on()
                         self.blank_mode = False
-                        self.mode_start_time = time.time()
-                        self.last_change = time.time()
+                        self.mode_start_time = now
+                        self.last_change = now
                     
                     if event.key == pygame.K_ESCAPE:
                         # Show mouse cursor before exiting
                         pygame.mouse.set_visible(True)
                         running = False
                     elif event.key == pygame.K_SPACE:
-                        print("Space pressed - advancing image")
+                        logger.debug("Space pressed - advancing image")
                         self.next_image()
                     elif event.key == pygame.K_b:
                         # Manual blank toggle for testing
                         if self.blank_mode:
-                            print("B pressed - waking monitor")
+                            logger.debug("B pressed - waking monitor")
                             self.turn_monitor_on()
                             self.blank_mode = False
-                            self.mode_start_time = time.time()
+                            self.mode_start_time = now
                         else:
-                            print("B pressed - blanking monitor")
+                            logger.debug("B pressed - blanking monitor")
                             self.turn_monitor_off()
                             self.blank_mode = True
-                            self.mode_start_time = time.time()
+                            self.mode_start_time = now
                     elif event.key == pygame.K_r:
-                        print("R pressed - reloading config and images")
+                        logger.debug("R pressed - reloading config and images")
                         # Reload config
                         with open("config.json") as f:
                             self.config = json.load(f)
@@ -586,56 +920,57 @@ class PictureFrameDisplay:
                         self.interval = self.config['display']['slideshow_interval']
                         self.load_images()
                         self.current_image = self.load_current_image()
+                        self._update_base_surface()
             
             # Check for config file changes (live reload)
             self.check_config_changes()
             
             # Check if time to switch between slideshow and blank mode
-            time_in_mode = time.time() - self.mode_start_time
+            time_in_mode = now - self.mode_start_time
             if self.blank_mode:
                 # In blank mode - check if time to return to slideshow
                 if time_in_mode > self.blank_duration:
-                    print("Exiting blank mode - resuming slideshow")
+                    logger.debug("Exiting blank mode - resuming slideshow")
                     self.turn_monitor_on()
                     self.blank_mode = False
-                    self.mode_start_time = time.time()
-                    self.last_change = time.time()  # Reset image timer
+                    self.mode_start_time = now
+                    self.last_change = now  # Reset image timer
             else:
                 # In slideshow mode - check if time to blank
                 if time_in_mode > self.slideshow_duration:
-                    print("Entering blank mode for 30 seconds")
+                    logger.debug("Entering blank mode for 30 seconds")
                     self.turn_monitor_off()
                     self.blank_mode = True
-                    self.mode_start_time = time.time()
+                    self.mode_start_time = now
             
             # Render based on current mode
             if self.blank_mode:
-                # Show black screen
-                self.screen.fill((0, 0, 0))
+                # Draw the black frame once on entry; nothing changes on
+                # screen after that while the monitor is off
+                if not self._blank_drawn:
+                    self.screen.fill((0, 0, 0))
+                    pygame.display.flip()
+                    self._blank_drawn = True
             else:
+                self._blank_drawn = False
+
                 # Normal slideshow mode
                 # Check if time to change image
-                if time.time() - self.last_change > self.interval:
+                if now - self.last_change > self.interval:
                     self.next_image()
-                
-                # Render current image with overlays
-                if self.current_image:
-                    # Apply overlays
-                    display_image = self.current_image.copy()
-                    display_image = self.render_overlays(display_image)
-                    
-                    # Convert PIL image to pygame surface
-                    mode = display_image.mode
-                    size = display_image.size
-                    data = display_image.tobytes()
-                    
-                    py_image = pygame.image.fromstring(data, size, mode)
-                    self.screen.blit(py_image, (0, 0))
+
+                # Render cached base surface with overlays drawn on top
+                if self._base_surface is not None:
+                    self.screen.blit(self._base_surface, (0, 0))
+                    self.render_overlays_pygame()
                 else:
-                    print("WARNING: No current_image to display")
-            
-            pygame.display.flip()
-            self.clock.tick(30)  # 30 FPS for smooth overlays
+                    logger.warning("WARNING: No current_image to display")
+
+                pygame.display.flip()
+
+            # Idle at 2 FPS while blanked (just enough to poll events);
+            # 30 FPS for smooth overlays otherwise
+            self.clock.tick(2 if self.blank_mode else 30)
         
         pygame.quit()
 
@@ -0,0 +1,6 @@
+"""
+WSGI entry point for the Picture Frame web UI
+Run with a production server, e.g.:
+    waitress-serve --listen=0.0.0.0:5000 wsgi:app
+"""
+from app import app